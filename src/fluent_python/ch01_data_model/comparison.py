@@ -7,15 +7,16 @@ examples and the enhanced robust versions.
 
 from typing import Any
 
-# Import both implementations
-from .original import french_deck as original_deck
-from .original import vector as original_vector
+# The original implementations are imported inside each demo, so importing this
+# module (or the package) does not load both implementation trees
 from .robust import french_deck as robust_deck
 from .robust import vector as robust_vector
 
 
 def demonstrate_french_deck_differences() -> None:
     """Demonstrate differences between original and robust French deck implementations."""
+    from .original import french_deck as original_deck
+
     print("=" * 60)
     print("FRENCH DECK IMPLEMENTATION COMPARISON")
     print("=" * 60)
@@ -83,6 +84,8 @@ def demonstrate_french_deck_differences() -> None:
 
 def demonstrate_vector_differences() -> None:
     """Demonstrate differences between original and robust vector implementations."""
+    from .original import vector as original_vector
+
     print("\n\n" + "=" * 60)
     print("VECTOR IMPLEMENTATION COMPARISON")
     print("=" * 60)
@@ -143,6 +146,8 @@ def demonstrate_vector_differences() -> None:
 
 def demonstrate_type_annotations() -> None:
     """Demonstrate the value of type annotations in the robust implementation."""
+    from .original import french_deck as original_deck
+
     print("\n\n" + "=" * 60)
     print("TYPE ANNOTATION BENEFITS")
     print("=" * 60)
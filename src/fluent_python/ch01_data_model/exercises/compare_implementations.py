@@ -6,53 +6,56 @@ This script provides side-by-side analysis of the design differences,
 performance characteristics, and type safety improvements.
 """
 
+import functools
+import os
 import sys
 import timeit
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-# Add the project root to Python path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
-# Import both implementations  # noqa: E402
-from fluent_python.ch01_data_model.original.french_deck import (  # noqa: E402
-    Card as OriginalCard,
-)
-from fluent_python.ch01_data_model.original.french_deck import (  # noqa: E402
+# Import both implementations
+from fluent_python.ch01_data_model.original.french_deck import Card as OriginalCard
+from fluent_python.ch01_data_model.original.french_deck import (
     FrenchDeck as OriginalDeck,
 )
-from fluent_python.ch01_data_model.robust.french_deck import (  # noqa: E402
-    Card as RobustCard,
-)
-from fluent_python.ch01_data_model.robust.french_deck import (  # noqa: E402
-    FrenchDeck as RobustDeck,
-)
-from fluent_python.ch01_data_model.robust.french_deck import (  # noqa: E402
+from fluent_python.ch01_data_model.robust.french_deck import Card as RobustCard
+from fluent_python.ch01_data_model.robust.french_deck import FrenchDeck as RobustDeck
+from fluent_python.ch01_data_model.robust.french_deck import (
     Rank,
     Suit,
     cards_by_suit,
     high_card,
 )
 
-# Rich for beautiful output
-try:
+if TYPE_CHECKING:
     from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
 
-    # from rich.columns import Columns  # Unused
-    # from rich.pretty import pprint  # Unused
-    console = Console()
-    RICH_AVAILABLE = True
-except ImportError:
-    console = None
-    RICH_AVAILABLE = False
-    print("Install 'rich' for enhanced output: pip install rich")
+# Breakpoints are active when this file is run as a script; set FP_DEBUG=0 to
+# run straight through, or FP_DEBUG=1 to stop at them when imported.
+_DEBUG = os.environ.get("FP_DEBUG", "1" if __name__ == "__main__" else "0") == "1"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Optional[Console]":
+    """
+    Return a shared rich Console, or None if rich is not installed.
+
+    rich is imported and the Console constructed on first use rather than at
+    import time, so importing this module stays cheap.
+    """
+    try:
+        from rich.console import Console
+    except ImportError:
+        print("Install 'rich' for enhanced output: pip install rich")
+        return None
+    return Console()
 
 
 def compare_card_implementations() -> None:
     """Compare Card implementations between original and robust versions."""
-    if RICH_AVAILABLE:
+    console = _get_console()
+    if console is not None:
+        from rich.panel import Panel
+
         console.print(Panel.fit("🃏 Card Implementation Comparison", style="bold blue"))
     else:
         print("=== Card Implementation Comparison ===")
@@ -61,15 +64,16 @@ def compare_card_implementations() -> None:
     original_card = OriginalCard("A", "spades")
     robust_card = RobustCard(Rank.ACE, Suit.SPADES)
 
-    breakpoint()  # 🔍 DEBUG POINT 1: Examine card structures
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 1: Examine card structures
 
     # Comparison data
     comparisons = [
-        ("Data Structure", "namedtuple", "@dataclass(frozen=True, order=True)"),
-        ("Rank Type", "str", "Rank(Enum)"),
-        ("Suit Type", "str", "Suit(Enum)"),
-        ("Immutable", "✓ (namedtuple)", "✓ (@frozen)"),
-        ("Ordered", "✗", "✓ (order=True)"),
+        ("Data Structure", "namedtuple", "typing.NamedTuple"),
+        ("Rank Type", "str", "Rank(IntEnum)"),
+        ("Suit Type", "str", "Suit(IntEnum)"),
+        ("Immutable", "✓ (namedtuple)", "✓ (NamedTuple)"),
+        ("Ordered", "✗", "✓ (rank, then suit)"),
         ("Type Safety", "Runtime only", "Development + Runtime"),
         (
             "Memory",
@@ -84,7 +88,9 @@ def compare_card_implementations() -> None:
         ),
     ]
 
-    if RICH_AVAILABLE:
+    if console is not None:
+        from rich.table import Table
+
         table = Table(title="Card Implementation Details")
         table.add_column("Feature", style="cyan")
         table.add_column("Original", style="magenta")
@@ -101,7 +107,8 @@ def compare_card_implementations() -> None:
 
     # Test error handling
     print("\n=== Error Handling Comparison ===")
-    breakpoint()  # 🔍 DEBUG POINT 2: Test error behavior
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 2: Test error behavior
 
     # Original accepts any strings
     invalid_original = OriginalCard("invalid_rank", "invalid_suit")
@@ -118,7 +125,10 @@ def compare_card_implementations() -> None:
 
 def compare_deck_implementations() -> None:
     """Compare FrenchDeck implementations."""
-    if RICH_AVAILABLE:
+    console = _get_console()
+    if console is not None:
+        from rich.panel import Panel
+
         console.print(
             Panel.fit("🎴 Deck Implementation Comparison", style="bold green")
         )
@@ -129,7 +139,8 @@ def compare_deck_implementations() -> None:
     original_deck = OriginalDeck()
     robust_deck = RobustDeck()
 
-    breakpoint()  # 🔍 DEBUG POINT 3: Examine deck structures
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 3: Examine deck structures
 
     # Basic functionality comparison
     print("=== Basic Functionality ===")
@@ -146,7 +157,8 @@ def compare_deck_implementations() -> None:
     print(f"Original: {type(original_slice)} = {original_slice}")
     print(f"Robust: {type(robust_slice)} = {robust_slice}")
 
-    breakpoint()  # 🔍 DEBUG POINT 4: Compare slicing behavior
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 4: Compare slicing behavior
 
     # Enhanced methods available only in robust version
     print("\n=== Enhanced Methods (Robust Only) ===")
@@ -169,45 +181,68 @@ def compare_deck_implementations() -> None:
         print(f"Error in enhanced methods: {e}")
 
 
+def _best_time(stmt: str, number: int, **namespace: object) -> float:
+    """
+    Time ``stmt`` and return the fastest of several runs.
+
+    The statement is compiled by timeit against ``namespace``, so no lambda
+    call is included in the measurement, and taking the minimum filters out
+    interference from the rest of the system.
+    """
+    return min(timeit.Timer(stmt, globals=namespace).repeat(repeat=5, number=number))
+
+
 def performance_comparison() -> None:
     """Compare performance characteristics."""
-    if RICH_AVAILABLE:
+    console = _get_console()
+    if console is not None:
+        from rich.panel import Panel
+
         console.print(Panel.fit("🏃 Performance Comparison", style="bold yellow"))
     else:
         print("\n=== Performance Comparison ===")
 
-    breakpoint()  # 🔍 DEBUG POINT 5: Performance analysis
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 5: Performance analysis
 
     # Deck creation time
-    original_time = timeit.timeit(lambda: OriginalDeck(), number=1000)
-    robust_time = timeit.timeit(lambda: RobustDeck(), number=1000)
+    original_time = _best_time("OriginalDeck()", 1000, OriginalDeck=OriginalDeck)
+    robust_time = _best_time("RobustDeck()", 1000, RobustDeck=RobustDeck)
 
     # Card creation time
-    original_card_time = timeit.timeit(
-        lambda: OriginalCard("A", "spades"), number=10000
+    original_card_time = _best_time(
+        "OriginalCard('A', 'spades')", 10000, OriginalCard=OriginalCard
     )
-    robust_card_time = timeit.timeit(
-        lambda: RobustCard(Rank.ACE, Suit.SPADES), number=10000
+    robust_card_time = _best_time(
+        "RobustCard(Rank.ACE, Suit.SPADES)",
+        10000,
+        RobustCard=RobustCard,
+        Rank=Rank,
+        Suit=Suit,
     )
 
     # Card access time
     orig_deck = OriginalDeck()
     rob_deck = RobustDeck()
 
-    orig_access_time = timeit.timeit(lambda: orig_deck[25], number=100000)
-    rob_access_time = timeit.timeit(lambda: rob_deck[25], number=100000)
-
-    # Memory usage
-    import sys
+    orig_access_time = _best_time("deck[25]", 100000, deck=orig_deck)
+    rob_access_time = _best_time("deck[25]", 100000, deck=rob_deck)
 
-    orig_deck_memory = sys.getsizeof(orig_deck._cards) + sum(
-        sys.getsizeof(card) for card in orig_deck._cards
+    # Memory usage (every card in a deck has the same size, so scale one)
+    orig_deck_memory = sys.getsizeof(orig_deck._cards) + (
+        len(orig_deck._cards) * sys.getsizeof(orig_deck._cards[0])
+        if orig_deck._cards
+        else 0
     )
-    rob_deck_memory = sys.getsizeof(rob_deck._cards) + sum(
-        sys.getsizeof(card) for card in rob_deck._cards
+    rob_deck_memory = sys.getsizeof(rob_deck._cards) + (
+        len(rob_deck._cards) * sys.getsizeof(rob_deck._cards[0])
+        if rob_deck._cards
+        else 0
     )
 
-    if RICH_AVAILABLE:
+    if console is not None:
+        from rich.table import Table
+
         perf_table = Table(title="Performance Metrics")
         perf_table.add_column("Operation", style="cyan")
         perf_table.add_column("Original", style="magenta")
@@ -279,12 +314,16 @@ def performance_comparison() -> None:
 
 def type_safety_demonstration() -> None:
     """Demonstrate type safety improvements."""
-    if RICH_AVAILABLE:
+    console = _get_console()
+    if console is not None:
+        from rich.panel import Panel
+
         console.print(Panel.fit("🛡️ Type Safety Demonstration", style="bold red"))
     else:
         print("\n=== Type Safety Demonstration ===")
 
-    breakpoint()  # 🔍 DEBUG POINT 6: Type safety analysis
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 6: Type safety analysis
 
     print("=== IDE and MyPy Benefits ===")
     print("The robust implementation provides:")
@@ -313,7 +352,10 @@ def type_safety_demonstration() -> None:
 
 def main() -> None:
     """Run comprehensive comparison of implementations."""
-    if RICH_AVAILABLE:
+    console = _get_console()
+    if console is not None:
+        from rich.panel import Panel
+
         console.print(
             Panel.fit(
                 "Fluent Python Chapter 1: Implementation Comparison\n"
@@ -330,6 +372,7 @@ def main() -> None:
     🐛 DEBUGGING INSTRUCTIONS:
     
     This script has 6 debug points for systematic exploration:
+    (Set FP_DEBUG=0 to run straight through without stopping.)
     
     1. Card structure comparison
     2. Error handling differences  
@@ -371,7 +414,7 @@ def main() -> None:
         print("\n\nDebugging session interrupted.")
     except Exception as e:
         print(f"\nUnexpected error: {type(e).__name__}: {e}")
-        if RICH_AVAILABLE:
+        if console is not None:
             console.print_exception()
 
 
@@ -5,19 +5,19 @@ Interactive debugging script for the original FrenchDeck implementation.
 Run this script and use the debugger to step through the classic Fluent Python code.
 """
 
-import sys
-from pathlib import Path
+import os
+from itertools import islice
 
-# Add the project root to Python path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
-from fluent_python.ch01_data_model.original.french_deck import (  # noqa: E402
+from fluent_python.ch01_data_model.original.french_deck import (
     Card,
     FrenchDeck,
     spades_high,
 )
 
+# Breakpoints are active when this file is run as a script; set FP_DEBUG=0 to
+# run straight through, or FP_DEBUG=1 to stop at them when imported.
+_DEBUG = os.environ.get("FP_DEBUG", "1" if __name__ == "__main__" else "0") == "1"
+
 
 def debug_original_french_deck() -> None:
     """
@@ -31,20 +31,23 @@ def debug_original_french_deck() -> None:
     print("=== Debugging Original FrenchDeck Implementation ===")
 
     # Set a breakpoint here to start debugging
-    breakpoint()  # 🔍 DEBUG POINT 1: Start here
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 1: Start here
 
-    # Create a deck - step into __init__ to see how cards are created
+    # Create a deck - step into __init__ to see how the card template is copied
     print("Creating deck...")
     deck = FrenchDeck()
 
-    breakpoint()  # 🔍 DEBUG POINT 2: Examine the deck object
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 2: Examine the deck object
 
     # Examine the structure
     print(f"Deck length: {len(deck)}")  # Calls __len__
     print(f"Type of deck._cards: {type(deck._cards)}")
     print(f"First few cards: {deck._cards[:3]}")
 
-    breakpoint()  # 🔍 DEBUG POINT 3: Look at card structure
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 3: Look at card structure
 
     # Get individual cards - this calls __getitem__
     first_card = deck[0]
@@ -55,7 +58,8 @@ def debug_original_french_deck() -> None:
     print(f"Card type: {type(first_card)}")
     print(f"Card fields: {first_card._fields}")
 
-    breakpoint()  # 🔍 DEBUG POINT 4: Explore card properties
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 4: Explore card properties
 
     # Test slicing - also calls __getitem__
     first_three = deck[:3]
@@ -63,12 +67,11 @@ def debug_original_french_deck() -> None:
 
     # Test iteration - Python calls __getitem__ repeatedly since no __iter__
     print("Iterating through first 5 cards:")
-    for i, card in enumerate(deck):  # type: ignore
-        if i >= 5:
-            break
+    for i, card in enumerate(islice(deck, 5)):  # type: ignore
         print(f"  {i}: {card}")
 
-    breakpoint()  # 🔍 DEBUG POINT 5: See how iteration works without __iter__
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 5: See how iteration works without __iter__
 
     # Test membership - Python iterates through since no __contains__
     ace_of_spades = Card("A", "spades")
@@ -78,7 +81,8 @@ def debug_original_french_deck() -> None:
     some_cards = [deck[0], deck[13], deck[26], deck[39]]  # One from each suit
     print(f"Sample cards: {some_cards}")
 
-    breakpoint()  # 🔍 DEBUG POINT 6: Examine ranking
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 6: Examine ranking
 
     # Sort cards using spades_high function
     sorted_cards = sorted(some_cards, key=spades_high)
@@ -88,7 +92,7 @@ def debug_original_french_deck() -> None:
     print("1. How namedtuple creates Card with ._fields and indexing")
     print("2. How __len__ and __getitem__ provide sequence protocol")
     print("3. How Python falls back to __getitem__ for iteration")
-    print("4. How list comprehension creates the full deck")
+    print("4. How the deck copies a prebuilt tuple of cards")
     print("5. How the ranking function works with card attributes")
 
 
@@ -99,6 +103,7 @@ if __name__ == "__main__":
     🐛 DEBUGGING INSTRUCTIONS:
     
     This script has multiple breakpoint() calls. At each one:
+    (Set FP_DEBUG=0 to run straight through without stopping.)
     
     1. Use 'l' (list) to see current code
     2. Use 'p variable_name' to print variables
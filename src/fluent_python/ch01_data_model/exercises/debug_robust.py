@@ -5,14 +5,9 @@ Interactive debugging script for the robust FrenchDeck implementation.
 Run this script and use the debugger to step through the enhanced, fully-typed version.
 """
 
-import sys
-from pathlib import Path
+import os
 
-# Add the project root to Python path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
-from fluent_python.ch01_data_model.robust.french_deck import (  # noqa: E402
+from fluent_python.ch01_data_model.robust.french_deck import (
     Card,
     FrenchDeck,
     Rank,
@@ -21,6 +16,10 @@ from fluent_python.ch01_data_model.robust.french_deck import (  # noqa: E402
     high_card,
 )
 
+# Breakpoints are active when this file is run as a script; set FP_DEBUG=0 to
+# run straight through, or FP_DEBUG=1 to stop at them when imported.
+_DEBUG = os.environ.get("FP_DEBUG", "1" if __name__ == "__main__" else "0") == "1"
+
 
 def debug_robust_french_deck() -> None:
     """
@@ -28,7 +27,7 @@ def debug_robust_french_deck() -> None:
 
     This function demonstrates the enhanced features:
     - Enum-based type safety for ranks and suits
-    - Dataclass with frozen/ordered behavior
+    - Typed NamedTuple with immutable/ordered behavior
     - Full type annotations and overloads
     - Protocol compliance with Sequence[Card]
     - Enhanced error handling
@@ -36,16 +35,18 @@ def debug_robust_french_deck() -> None:
     print("=== Debugging Robust FrenchDeck Implementation ===")
 
     # Set a breakpoint here to start debugging
-    breakpoint()  # 🔍 DEBUG POINT 1: Start here
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 1: Start here
 
     # Explore the enum types first
     print("Examining enum types...")
-    print(f"Rank.ACE: {Rank.ACE}")
+    print(f"Rank.ACE: {Rank.ACE!r}")
     print(f"Rank.ACE.value: {Rank.ACE.value}")
-    print(f"Suit.SPADES: {Suit.SPADES}")
+    print(f"Suit.SPADES: {Suit.SPADES!r}")
     print(f"All ranks: {list(Rank)}")
 
-    breakpoint()  # 🔍 DEBUG POINT 2: Examine enum behavior
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 2: Examine enum behavior
 
     # Create individual cards - step into Card creation
     ace_of_spades = Card(Rank.ACE, Suit.SPADES)
@@ -55,11 +56,12 @@ def debug_robust_french_deck() -> None:
     print(f"String representation: {str(ace_of_spades)}")
     print(f"Repr: {repr(ace_of_spades)}")
 
-    breakpoint()  # 🔍 DEBUG POINT 3: Explore Card dataclass features
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 3: Explore Card NamedTuple features
 
-    # Test card comparison (thanks to dataclass order=True)
+    # Test card comparison (Card.__lt__ orders by rank, then suit)
     print(f"Ace > King: {ace_of_spades > king_of_hearts}")
-    print(f"Cards are frozen: {ace_of_spades.__dataclass_fields__}")
+    print(f"Card fields: {ace_of_spades._fields}")
 
     # Try to modify (should fail)
     try:
@@ -67,7 +69,8 @@ def debug_robust_french_deck() -> None:
     except Exception as e:
         print(f"Immutability works: {e}")
 
-    breakpoint()  # 🔍 DEBUG POINT 4: Test immutability and ordering
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 4: Test immutability and ordering
 
     # Create a deck - step into enhanced __init__
     print("Creating robust deck...")
@@ -79,7 +82,8 @@ def debug_robust_french_deck() -> None:
         f"Deck is a Sequence: {isinstance(deck, list) or hasattr(deck, '__getitem__')}"
     )
 
-    breakpoint()  # 🔍 DEBUG POINT 5: Examine deck structure
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 5: Examine deck structure
 
     # Test overloaded __getitem__ behavior
     single_card = deck[0]  # Returns Card
@@ -90,7 +94,8 @@ def debug_robust_french_deck() -> None:
     print(f"Single card: {single_card}")
     print(f"Multiple cards: {multiple_cards}")
 
-    breakpoint()  # 🔍 DEBUG POINT 6: Examine type system behavior
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 6: Examine type system behavior
 
     # Test enhanced methods
     print("Testing enhanced deck methods...")
@@ -105,7 +110,8 @@ def debug_robust_french_deck() -> None:
     highest = high_card(sample_cards)
     print(f"Highest card from sample: {highest}")
 
-    breakpoint()  # 🔍 DEBUG POINT 7: Explore utility functions
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 7: Explore utility functions
 
     # Test deck mutation methods
     original_first_card = deck[0]
@@ -123,7 +129,8 @@ def debug_robust_french_deck() -> None:
     deck.sort(by_suit=False)
     print(f"After sort by rank: {deck[:4]}")
 
-    breakpoint()  # 🔍 DEBUG POINT 8: Examine mutation methods
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 8: Examine mutation methods
 
     # Test error handling
     print("Testing error handling...")
@@ -139,7 +146,7 @@ def debug_robust_french_deck() -> None:
 
     print("\n=== Key Enhancements to Observe ===")
     print("1. Enum types provide better type safety and debugging")
-    print("2. Dataclass gives us immutability and comparison for free")
+    print("2. NamedTuple gives us immutability and a compact layout for free")
     print("3. Type annotations help catch errors at development time")
     print("4. Overloads provide precise typing for different use cases")
     print("5. Protocol compliance makes deck work with generic functions")
@@ -152,7 +159,8 @@ def compare_implementations() -> None:
     """
     print("\n=== IMPLEMENTATION COMPARISON ===")
 
-    breakpoint()  # 🔍 DEBUG POINT 9: Compare implementations
+    if _DEBUG:
+        breakpoint()  # 🔍 DEBUG POINT 9: Compare implementations
 
     # Import both
     from fluent_python.ch01_data_model.original.french_deck import Card as OriginalCard
@@ -171,7 +179,7 @@ def compare_implementations() -> None:
     print(f"Original card: {original_card} (type: {type(original_card)})")
     print(f"Robust card: {robust_card} (type: {type(robust_card)})")
     print(f"Original fields: {original_card._fields}")
-    print(f"Robust fields: {robust_card.__dataclass_fields__.keys()}")
+    print(f"Robust fields: {robust_card._fields}")
 
     print("\n=== Behavior Comparison ===")
     print(f"Original supports < comparison: {hasattr(original_card, '__lt__')}")
@@ -188,16 +196,17 @@ if __name__ == "__main__":
     🐛 DEBUGGING INSTRUCTIONS:
     
     This script explores the enhanced implementation with these debugging tips:
+    (Set FP_DEBUG=0 to run straight through without stopping.)
     
     🔍 At each breakpoint, try:
     - p Rank.ACE.__dict__
-    - p ace_of_spades.__dataclass_fields__
+    - p ace_of_spades._fields
     - p type(deck[0]) vs type(deck[:1])
     - pp [card for card in deck[:3]]
     
     🎯 Key things to observe:
     1. How enums provide better debugging info than strings
-    2. How dataclass generates methods automatically
+    2. How NamedTuple generates fields and methods automatically
     3. How type annotations affect IDE behavior
     4. How overloads provide different return types
     5. How protocol compliance enables generic functions
@@ -17,7 +17,7 @@ class FrenchDeck:
     suits = "spades diamonds clubs hearts".split()
 
     def __init__(self):
-        self._cards = [Card(rank, suit) for suit in self.suits for rank in self.ranks]
+        self._cards = list(_DEFAULT_CARDS)
 
     def __len__(self):
         return len(self._cards)
@@ -26,6 +26,12 @@ class FrenchDeck:
         return self._cards[position]
 
 
+# Cards are immutable namedtuples, so build them once and copy the tuple per deck
+_DEFAULT_CARDS = tuple(
+    Card(rank, suit) for suit in FrenchDeck.suits for rank in FrenchDeck.ranks
+)
+
+
 # Utility function for card ranking (Bridge-style)
 suit_values = dict(spades=3, hearts=2, diamonds=1, clubs=0)
 
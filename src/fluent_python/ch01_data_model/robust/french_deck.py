@@ -11,29 +11,28 @@ but with added type safety, documentation, and error handling.
 from __future__ import annotations
 
 import random
-from collections.abc import Iterator, Sequence
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Any, Final, Union, overload
+from collections.abc import Iterable, Iterator, Sequence
+from enum import IntEnum, auto
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Callable, Final, NamedTuple, Union, overload
 
 
-class Suit(Enum):
-    """Card suit enumeration with explicit ordering for comparison operations."""
+class Suit(IntEnum):
+    """
+    Card suit enumeration ordered Spades < Hearts < Diamonds < Clubs.
+
+    As an IntEnum, members compare and hash as plain ints in C.
+    """
 
     SPADES = auto()
     HEARTS = auto()
     DIAMONDS = auto()
     CLUBS = auto()
 
-    def __lt__(self, other: Any) -> bool:
-        """Enable suit comparison for sorting. Spades > Hearts > Diamonds > Clubs."""
-        if not isinstance(other, Suit):
-            return NotImplemented
-        return self.value < other.value
 
-
-class Rank(Enum):
-    """Card rank enumeration with poker-style ordering."""
+class Rank(IntEnum):
+    """Card rank enumeration with poker-style ordering (Ace high)."""
 
     TWO = 2
     THREE = 3
@@ -49,24 +48,76 @@ class Rank(Enum):
     KING = 13
     ACE = 14
 
-    def __lt__(self, other: Any) -> bool:
-        """Enable rank comparison for sorting."""
-        if not isinstance(other, Rank):
-            return NotImplemented
-        return self.value < other.value
+
+# Display names used by Card.__str__, built once rather than on every call
+_RANK_NAMES: Final[dict[Rank, str]] = {
+    Rank.TWO: "2",
+    Rank.THREE: "3",
+    Rank.FOUR: "4",
+    Rank.FIVE: "5",
+    Rank.SIX: "6",
+    Rank.SEVEN: "7",
+    Rank.EIGHT: "8",
+    Rank.NINE: "9",
+    Rank.TEN: "10",
+    Rank.JACK: "Jack",
+    Rank.QUEEN: "Queen",
+    Rank.KING: "King",
+    Rank.ACE: "Ace",
+}
+
+_SUIT_NAMES: Final[dict[Suit, str]] = {
+    Suit.SPADES: "Spades",
+    Suit.HEARTS: "Hearts",
+    Suit.DIAMONDS: "Diamonds",
+    Suit.CLUBS: "Clubs",
+}
 
 
 # Type alias for cleaner type hints
 IndexType = Union[int, slice]
 
 
-@dataclass(frozen=True, order=True)
-class Card:
+def _card_comparison(name: str, symbol: str) -> Callable[[Card, Any], bool]:
+    """
+    Build the Card comparison method called name (e.g. "__lt__").
+
+    Cards compare with each other as (rank, suit) tuples. Any other tuple is
+    foreign: never equal to a Card and not orderable against one. Returning
+    NotImplemented is not enough for tuples, because Python would then fall
+    back to the tuple's reflected method, which accepts a Card since Card
+    subclasses tuple.
+    """
+    compare = getattr(tuple, name)
+    foreign_result = {"__eq__": False, "__ne__": True}.get(name)
+
+    def method(self: Card, other: Any) -> Any:
+        if isinstance(other, Card):
+            return compare(self, other)
+        if isinstance(other, tuple):
+            if foreign_result is None:
+                raise TypeError(
+                    f"'{symbol}' not supported between instances of 'Card' "
+                    f"and '{type(other).__name__}'"
+                )
+            return foreign_result
+        return NotImplemented
+
+    method.__name__ = name
+    method.__qualname__ = f"Card.{name}"
+    method.__doc__ = f"Return self {symbol} other for two Cards."
+    return method
+
+
+class Card(NamedTuple):
     """
     A playing card with rank and suit.
 
-    This implementation uses frozen dataclass for immutability and automatic
-    comparison methods. The order is defined by rank first, then suit.
+    This implementation uses a typed NamedTuple: it is immutable by construction
+    and stored in a compact tuple layout with no per-instance __dict__.
+    Two Cards compare as (rank, suit) tuples, so the order is rank first,
+    then suit. Unlike a bare NamedTuple, a Card is never equal to a plain
+    tuple and cannot be ordered against one.
 
     Examples:
         >>> card = Card(Rank.ACE, Suit.SPADES)
@@ -83,36 +134,55 @@ class Card:
 
     def __str__(self) -> str:
         """Return human-readable card representation."""
-        rank_names: Final[dict[Rank, str]] = {
-            Rank.TWO: "2",
-            Rank.THREE: "3",
-            Rank.FOUR: "4",
-            Rank.FIVE: "5",
-            Rank.SIX: "6",
-            Rank.SEVEN: "7",
-            Rank.EIGHT: "8",
-            Rank.NINE: "9",
-            Rank.TEN: "10",
-            Rank.JACK: "Jack",
-            Rank.QUEEN: "Queen",
-            Rank.KING: "King",
-            Rank.ACE: "Ace",
-        }
-
-        suit_names: Final[dict[Suit, str]] = {
-            Suit.SPADES: "Spades",
-            Suit.HEARTS: "Hearts",
-            Suit.DIAMONDS: "Diamonds",
-            Suit.CLUBS: "Clubs",
-        }
-
-        return f"{rank_names[self.rank]} of {suit_names[self.suit]}"
+        try:
+            return _STR_TABLE[self]
+        except KeyError:
+            return f"{_RANK_NAMES[self.rank]} of {_SUIT_NAMES[self.suit]}"
 
     def __repr__(self) -> str:
         """Return developer-friendly representation."""
         return f"Card({self.rank!r}, {self.suit!r})"
 
 
+# Attached after the class body because typing.NamedTuple treats assignments
+# there as fields. Setting __eq__ here also leaves the tuple __hash__ in place.
+for _name, _symbol in (
+    ("__eq__", "=="),
+    ("__ne__", "!="),
+    ("__lt__", "<"),
+    ("__le__", "<="),
+    ("__gt__", ">"),
+    ("__ge__", ">="),
+):
+    setattr(Card, _name, _card_comparison(_name, _symbol))
+del _name, _symbol
+
+
+# Cards are immutable, so every deck can share the same 52 instances; a deck
+# then only owns the list of references, not the cards themselves.
+_DEFAULT_CARDS: Final[tuple[Card, ...]] = tuple(
+    Card(rank, suit) for suit in Suit for rank in Rank
+)
+# There are only 52 valid cards, so their strings are formatted once up front
+_STR_TABLE: Final[dict[Card, str]] = {
+    card: f"{_RANK_NAMES[card.rank]} of {_SUIT_NAMES[card.suit]}"
+    for card in _DEFAULT_CARDS
+}
+# Shuffling and sorting only reorder a deck, so its set of cards never changes
+_DEFAULT_CARD_SET: Final[frozenset[Card]] = frozenset(_DEFAULT_CARDS)
+_CARDS_BY_SUIT: Final[dict[Suit, tuple[Card, ...]]] = {
+    suit: tuple(card for card in _DEFAULT_CARDS if card.suit is suit) for suit in Suit
+}
+# Sort keys packed into single ints, so sort() compares one int per card
+# instead of building a (rank, suit) tuple for each
+_RANK_MAJOR_KEY: Final[dict[Card, int]] = {
+    card: card.rank.value << 3 | card.suit.value for card in _DEFAULT_CARDS
+}
+_SUIT_MAJOR_KEY: Final[dict[Card, int]] = {
+    card: card.suit.value << 4 | card.rank.value for card in _DEFAULT_CARDS
+}
+
+
 class FrenchDeck(Sequence[Card]):
     """
     A deck of 52 French playing cards.
@@ -139,9 +209,12 @@ class FrenchDeck(Sequence[Card]):
         True
     """
 
+    # No per-instance __dict__; keep __weakref__ so decks stay weakly referenceable
+    __slots__ = ("__weakref__", "_cards")
+
     def __init__(self) -> None:
         """Initialize a complete deck of 52 cards."""
-        self._cards: list[Card] = [Card(rank, suit) for suit in Suit for rank in Rank]
+        self._cards: list[Card] = list(_DEFAULT_CARDS)
 
     def __len__(self) -> int:
         """Return the number of cards in the deck."""
@@ -167,14 +240,9 @@ class FrenchDeck(Sequence[Card]):
             IndexError: If position is out of bounds
             TypeError: If position is not int or slice
         """
-        if isinstance(position, int):
-            return self._cards[position]
-        elif isinstance(position, slice):
-            return self._cards[position]
-        else:
-            raise TypeError(
-                f"indices must be integers or slices, not {type(position).__name__}"
-            )
+        # list.__getitem__ already accepts ints and slices and raises the
+        # documented IndexError/TypeError for anything else
+        return self._cards[position]
 
     def __iter__(self) -> Iterator[Card]:
         """Return iterator over cards in the deck."""
@@ -185,8 +253,8 @@ class FrenchDeck(Sequence[Card]):
         return reversed(self._cards)
 
     def __contains__(self, card: object) -> bool:
-        """Check if card is in the deck."""
-        return card in self._cards
+        """Check if card is in the deck with a single hash lookup."""
+        return isinstance(card, Card) and card in _DEFAULT_CARD_SET
 
     def __repr__(self) -> str:
         """Return developer-friendly representation."""
@@ -213,13 +281,26 @@ class FrenchDeck(Sequence[Card]):
             by_suit: If True, sort by suit first, then rank.
                     If False, sort by rank first, then suit.
         """
-        if by_suit:
-            self._cards.sort(key=lambda card: (card.suit, card.rank))
-        else:
-            self._cards.sort(key=lambda card: (card.rank, card.suit))
+        sort_key = _SUIT_MAJOR_KEY if by_suit else _RANK_MAJOR_KEY
+        self._cards.sort(key=sort_key.__getitem__)
+
+
+# C-implemented key function; Rank is an IntEnum, so max() compares in C too
+_rank_of = attrgetter("rank")
 
 
 # Utility functions demonstrating different ways to work with the deck
+def _high_card_unchecked(cards: Iterable[Card]) -> Card:
+    """
+    Return the highest card without validating the input.
+
+    For tight loops (e.g. simulating many hands) where the caller already
+    guarantees that cards is non-empty; an empty input raises max()'s own
+    ValueError instead of high_card's message.
+    """
+    return max(cards, key=_rank_of)
+
+
 def high_card(cards: Sequence[Card]) -> Card:
     """
     Return the highest card from a sequence of cards.
@@ -241,7 +322,7 @@ def high_card(cards: Sequence[Card]) -> Card:
     if not cards:
         raise ValueError("Cannot find high card in empty sequence")
 
-    return max(cards, key=lambda card: card.rank.value)
+    return _high_card_unchecked(cards)
 
 
 def cards_by_suit(deck: FrenchDeck, suit: Suit) -> list[Card]:
@@ -253,7 +334,10 @@ def cards_by_suit(deck: FrenchDeck, suit: Suit) -> list[Card]:
         suit: The suit to filter by
 
     Returns:
-        List of cards matching the suit
+        List of cards matching the suit, in rank order
+
+    Every deck holds the same 52 cards (shuffle and sort only reorder them),
+    so the result comes from a per-suit index built once at import.
 
     Examples:
         >>> deck = FrenchDeck()
@@ -261,7 +345,7 @@ def cards_by_suit(deck: FrenchDeck, suit: Suit) -> list[Card]:
         >>> len(spades)
         13
     """
-    return [card for card in deck if card.suit == suit]
+    return list(_CARDS_BY_SUIT[suit])
 
 
 def demonstrate_special_methods() -> None:
@@ -289,9 +373,7 @@ def demonstrate_special_methods() -> None:
     # Iteration calls __iter__ (which we implemented)
     # or falls back to __getitem__ + __len__
     print("First 5 cards via iteration:")
-    for i, card in enumerate(deck):
-        if i >= 5:
-            break
+    for card in islice(deck, 5):
         print(f"  {card}")
 
     # random.choice works because deck supports indexing and len
@@ -304,7 +386,7 @@ def demonstrate_special_methods() -> None:
     print(f"Ace of Spades in deck: {ace_of_spades in deck}")
 
     # Sorting works with any iterable
-    sorted_by_rank = sorted(deck, key=lambda card: card.rank.value)
+    sorted_by_rank = sorted(deck, key=_rank_of)
     print(f"Lowest card: {sorted_by_rank[0]}")
     print(f"Highest card: {sorted_by_rank[-1]}")
 
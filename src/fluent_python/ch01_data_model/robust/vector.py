@@ -20,6 +20,8 @@ class Vector:
 
     This implementation shows how to make custom objects work naturally
     with Python operators and built-in functions through special methods.
+    Vectors are immutable: x and y are read-only properties, which keeps the
+    hash consistent with equality.
 
     Examples:
         >>> v1 = Vector(2, 4)
@@ -36,6 +38,11 @@ class Vector:
         True
     """
 
+    # No per-instance __dict__: attributes live in fixed slots, which makes
+    # instances smaller and attribute access faster. The coordinates are
+    # private and exposed read-only, so cached values can never go stale.
+    __slots__ = ("_x", "_y", "_magnitude", "_hash")
+
     def __init__(self, x: float = 0, y: float = 0) -> None:
         """
         Initialize a 2D vector.
@@ -44,32 +51,52 @@ class Vector:
             x: X coordinate (default: 0)
             y: Y coordinate (default: 0)
         """
-        self.x = float(x)
-        self.y = float(y)
+        self._x = float(x)
+        self._y = float(y)
+        # Vectors are immutable value objects, so the magnitude and hash can
+        # be cached
+        self._magnitude: float | None = None
+        self._hash: int | None = None
+
+    @property
+    def x(self) -> float:
+        """X coordinate (read-only)."""
+        return self._x
+
+    @property
+    def y(self) -> float:
+        """Y coordinate (read-only)."""
+        return self._y
 
     def __repr__(self) -> str:
         """Return developer-friendly representation."""
-        return f"Vector({self.x!r}, {self.y!r})"
+        return f"Vector({self._x!r}, {self._y!r})"
 
     def __str__(self) -> str:
         """Return human-readable representation."""
-        return f"({self.x}, {self.y})"
+        return f"({self._x}, {self._y})"
 
     def __abs__(self) -> float:
         """
         Return the magnitude (length) of the vector.
 
-        This enables abs(vector) to work naturally.
+        This enables abs(vector) to work naturally. The result is computed
+        on first use and cached on the instance.
         """
-        return math.hypot(self.x, self.y)
+        magnitude = self._magnitude
+        if magnitude is None:
+            magnitude = self._magnitude = math.hypot(self._x, self._y)
+        return magnitude
 
     def __bool__(self) -> bool:
         """
         Return True if vector is non-zero.
 
         This enables truthiness testing: if vector: ...
+        A vector is zero exactly when both components are, so no magnitude
+        (and no square root) is needed.
         """
-        return bool(abs(self))
+        return self._x != 0.0 or self._y != 0.0
 
     def __add__(self, other: Any) -> Vector:
         """
@@ -87,7 +114,7 @@ class Vector:
         if not isinstance(other, Vector):
             return NotImplemented
 
-        return Vector(self.x + other.x, self.y + other.y)
+        return _from_floats(self._x + other._x, self._y + other._y)
 
     def __mul__(self, scalar: Any) -> Vector:
         """
@@ -102,10 +129,16 @@ class Vector:
         Raises:
             TypeError: If scalar is not numeric
         """
+        # Exact-type checks cover the common case without walking the tuple
+        # and MROs that isinstance needs; subclasses such as bool still pass
+        scalar_type = type(scalar)
+        if scalar_type is float or scalar_type is int:
+            return _from_floats(self._x * scalar, self._y * scalar)
         if not isinstance(scalar, (int, float)):
             return NotImplemented
 
-        return Vector(self.x * scalar, self.y * scalar)
+        # Subclasses may not produce plain floats, so let __init__ convert
+        return Vector(self._x * scalar, self._y * scalar)
 
     def __rmul__(self, scalar: Any) -> Vector:
         """
@@ -131,23 +164,22 @@ class Vector:
         if not isinstance(other, Vector):
             return NotImplemented
 
-        return self.x == other.x and self.y == other.y
-
-    def __ne__(self, other: Any) -> bool:
-        """Test inequality with another vector."""
-        result = self.__eq__(other)
-        if result is NotImplemented:
-            return result
-        return not result
+        return self._x == other._x and self._y == other._y
 
     def __hash__(self) -> int:
         """
         Make Vector hashable so it can be used in sets and as dict keys.
 
+        The hash is computed on first use and cached, which is safe only
+        because the coordinates are read-only.
+
         Returns:
             Hash based on both coordinates
         """
-        return hash((self.x, self.y))
+        hash_value = self._hash
+        if hash_value is None:
+            hash_value = self._hash = hash((self._x, self._y))
+        return hash_value
 
     # Additional useful methods beyond the basic Fluent Python example
 
@@ -161,7 +193,7 @@ class Vector:
         Returns:
             Dot product (scalar)
         """
-        return self.x * other.x + self.y * other.y
+        return self._x * other._x + self._y * other._y
 
     def angle(self) -> float:
         """
@@ -170,7 +202,7 @@ class Vector:
         Returns:
             Angle from positive x-axis in radians
         """
-        return math.atan2(self.y, self.x)
+        return math.atan2(self._y, self._x)
 
     def normalized(self) -> Vector:
         """
@@ -183,10 +215,12 @@ class Vector:
             ValueError: If vector is zero (cannot normalize)
         """
         magnitude = abs(self)
-        if magnitude == 0:
+        if magnitude == 0.0:
             raise ValueError("Cannot normalize zero vector")
 
-        return Vector(self.x / magnitude, self.y / magnitude)
+        # Divide rather than multiply by 1.0 / magnitude: the reciprocal
+        # overflows for subnormal magnitudes and is not correctly rounded
+        return _from_floats(self._x / magnitude, self._y / magnitude)
 
     def distance_to(self, other: Vector) -> float:
         """
@@ -198,7 +232,7 @@ class Vector:
         Returns:
             Euclidean distance between vectors
         """
-        return abs(self - other)
+        return math.hypot(self._x - other._x, self._y - other._y)
 
     def __sub__(self, other: Vector) -> Vector:
         """
@@ -213,15 +247,34 @@ class Vector:
         if not isinstance(other, Vector):
             return NotImplemented
 
-        return Vector(self.x - other.x, self.y - other.y)
+        return _from_floats(self._x - other._x, self._y - other._y)
 
     def __neg__(self) -> Vector:
         """Return negated vector (-self)."""
-        return Vector(-self.x, -self.y)
+        return _from_floats(-self._x, -self._y)
 
     def __pos__(self) -> Vector:
         """Return positive vector (+self)."""
-        return Vector(+self.x, +self.y)
+        return _from_floats(+self._x, +self._y)
+
+
+_new_object = object.__new__
+
+
+def _from_floats(x: float, y: float) -> Vector:
+    """
+    Build a Vector from coordinates that are already floats.
+
+    Arithmetic results are floats by construction, so this skips the float()
+    conversions and method dispatch of Vector(x, y). It must set every slot
+    that __init__ sets.
+    """
+    vector = _new_object(Vector)
+    vector._x = x
+    vector._y = y
+    vector._magnitude = None
+    vector._hash = None
+    return vector
 
 
 def demonstrate_vector_operations() -> None:
@@ -0,0 +1,220 @@
+"""
+VectorArray - Structure-of-Arrays Companion to Vector
+
+Vector is convenient for a handful of values, but every operation on it runs
+in the interpreter and allocates a new object. VectorArray stores a whole batch
+of 2D vectors as two parallel NumPy arrays (one for x, one for y), so bulk
+arithmetic runs as vectorized loops inside NumPy instead.
+
+This module requires NumPy. It is not re-exported by the package, so importing
+fluent_python keeps working without it. If Numba is installed, dot products and
+distances run through fused, JIT-compiled loops instead of NumPy expressions
+that allocate a temporary array per intermediate result. Numba is imported and
+the loops are compiled on the first call that needs them, not at import time.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .vector import Vector
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def _batch_dot(
+    x1: FloatArray, y1: FloatArray, x2: FloatArray, y2: FloatArray, out: FloatArray
+) -> FloatArray:
+    """Write the dot product of each pair of vectors into out."""
+    # Plain indexed loop so Numba's auto-vectorizer can handle it
+    for i in range(x1.shape[0]):
+        out[i] = x1[i] * x2[i] + y1[i] * y2[i]
+    return out
+
+
+def _batch_distance(
+    x1: FloatArray, y1: FloatArray, x2: FloatArray, y2: FloatArray, out: FloatArray
+) -> FloatArray:
+    """Write the distance between each pair of vectors into out."""
+    for i in range(x1.shape[0]):
+        out[i] = math.hypot(x1[i] - x2[i], y1[i] - y2[i])
+    return out
+
+
+_Kernel = Callable[
+    [FloatArray, FloatArray, FloatArray, FloatArray, FloatArray], FloatArray
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _kernels() -> Optional[tuple[_Kernel, _Kernel]]:
+    """
+    Return the JIT-compiled (dot, distance) kernels, or None without Numba.
+
+    Numba is optional and slow to import, so it is loaded on first use;
+    without it, VectorArray falls back to NumPy expressions.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_batch_dot), njit(cache=True)(_batch_distance)
+
+
+class VectorArray:
+    """
+    A batch of 2D vectors stored as parallel x and y arrays.
+
+    Operations apply element-wise across the batch and return either a new
+    VectorArray or an array with one value per vector.
+
+    Examples:
+        >>> a = VectorArray([3, 1], [4, 0])
+        >>> b = VectorArray([1, 2], [1, 2])
+        >>> a + b
+        VectorArray(xs=[4.0, 3.0], ys=[5.0, 2.0])
+        >>> abs(a).tolist()
+        [5.0, 1.0]
+        >>> a.dot(b).tolist()
+        [7.0, 2.0]
+    """
+
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs: npt.ArrayLike, ys: npt.ArrayLike) -> None:
+        """
+        Initialize a batch of vectors from coordinate sequences.
+
+        Args:
+            xs: X coordinates, one per vector
+            ys: Y coordinates, one per vector
+
+        Raises:
+            ValueError: If xs and ys are not one-dimensional and of equal length
+        """
+        self.xs: FloatArray = np.asarray(xs, dtype=np.float64)
+        self.ys: FloatArray = np.asarray(ys, dtype=np.float64)
+        if self.xs.ndim != 1 or self.xs.shape != self.ys.shape:
+            raise ValueError(
+                "xs and ys must be one-dimensional and of equal length, "
+                f"got shapes {self.xs.shape} and {self.ys.shape}"
+            )
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> VectorArray:
+        """
+        Build a VectorArray from individual Vector objects.
+
+        Args:
+            vectors: Vectors to pack, in order
+
+        Returns:
+            New VectorArray holding the same coordinates
+        """
+        vectors = list(vectors)
+        count = len(vectors)
+        xs = np.fromiter((v.x for v in vectors), dtype=np.float64, count=count)
+        ys = np.fromiter((v.y for v in vectors), dtype=np.float64, count=count)
+        return cls(xs, ys)
+
+    def __len__(self) -> int:
+        """Return the number of vectors in the batch."""
+        return len(self.xs)
+
+    def __iter__(self) -> Iterator[Vector]:
+        """Yield each vector in the batch as a Vector."""
+        for x, y in zip(self.xs.tolist(), self.ys.tolist()):
+            yield Vector(x, y)
+
+    def __repr__(self) -> str:
+        """Return developer-friendly representation."""
+        return f"VectorArray(xs={self.xs.tolist()!r}, ys={self.ys.tolist()!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        """Return True if both batches hold the same vectors in the same order."""
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        return bool(
+            np.array_equal(self.xs, other.xs) and np.array_equal(self.ys, other.ys)
+        )
+
+    def __add__(self, other: Any) -> VectorArray:
+        """Add two batches of vectors element-wise."""
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        return VectorArray(self.xs + other.xs, self.ys + other.ys)
+
+    def __sub__(self, other: Any) -> VectorArray:
+        """Subtract two batches of vectors element-wise."""
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        return VectorArray(self.xs - other.xs, self.ys - other.ys)
+
+    def __mul__(self, scalar: Any) -> VectorArray:
+        """Scale every vector in the batch by a scalar."""
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        return VectorArray(self.xs * scalar, self.ys * scalar)
+
+    def __rmul__(self, scalar: Any) -> VectorArray:
+        """Right multiplication (scalar * batch)."""
+        return self.__mul__(scalar)
+
+    def __abs__(self) -> FloatArray:
+        """Return the magnitude of each vector."""
+        return np.hypot(self.xs, self.ys)
+
+    def _check_same_length(self, other: VectorArray) -> None:
+        """Raise ValueError unless other holds as many vectors as self."""
+        if len(other) != len(self):
+            raise ValueError(
+                f"VectorArray lengths differ: {len(self)} and {len(other)}"
+            )
+
+    def dot(self, other: VectorArray) -> FloatArray:
+        """
+        Calculate the dot product of each pair of vectors.
+
+        Args:
+            other: Batch of the same length
+
+        Returns:
+            Array of dot products, one per pair
+
+        Raises:
+            ValueError: If the batches differ in length
+        """
+        self._check_same_length(other)
+        kernels = _kernels()
+        if kernels is not None:
+            batch_dot, _ = kernels
+            out = np.empty_like(self.xs)
+            return batch_dot(self.xs, self.ys, other.xs, other.ys, out)
+        return self.xs * other.xs + self.ys * other.ys
+
+    def distance_to(self, other: VectorArray) -> FloatArray:
+        """
+        Calculate the distance between each pair of vectors.
+
+        Args:
+            other: Batch of the same length
+
+        Returns:
+            Array of Euclidean distances, one per pair
+
+        Raises:
+            ValueError: If the batches differ in length
+        """
+        self._check_same_length(other)
+        kernels = _kernels()
+        if kernels is not None:
+            _, batch_distance = kernels
+            out = np.empty_like(self.xs)
+            return batch_distance(self.xs, self.ys, other.xs, other.ys, out)
+        return np.hypot(self.xs - other.xs, self.ys - other.ys)
@@ -0,0 +1,23 @@
+"""
+Shared fixtures for the Chapter 1 data model tests.
+"""
+
+import pytest
+
+from fluent_python.ch01_data_model.robust.french_deck import Card, FrenchDeck
+
+
+@pytest.fixture(scope="session")
+def reference_deck() -> FrenchDeck:
+    """
+    A single unshuffled deck shared by every read-only test.
+
+    Tests that shuffle or sort must build their own FrenchDeck instead.
+    """
+    return FrenchDeck()
+
+
+@pytest.fixture(scope="session")
+def reference_cards(reference_deck: FrenchDeck) -> tuple[Card, ...]:
+    """The cards of reference_deck in their default order, materialized once."""
+    return tuple(reference_deck)
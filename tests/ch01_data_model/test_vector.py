@@ -8,10 +8,12 @@ Tests cover:
 - Type safety
 """
 
+import io
 import math
+from contextlib import redirect_stdout
 
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from fluent_python.ch01_data_model.robust.vector import (
@@ -19,6 +21,18 @@ from fluent_python.ch01_data_model.robust.vector import (
     demonstrate_vector_operations,
 )
 
+# float32-width values shrink faster and are plenty for checking algebraic
+# identities on 2D vectors
+coordinates = st.floats(
+    min_value=-100, max_value=100, allow_nan=False, allow_infinity=False, width=32
+)
+scalars = st.floats(
+    min_value=-10, max_value=10, allow_nan=False, allow_infinity=False, width=32
+)
+positive_coordinates = st.floats(
+    min_value=0.125, max_value=100, allow_nan=False, allow_infinity=False, width=32
+)
+
 
 class TestVector:
     """Test cases for the Vector class."""
@@ -34,6 +48,26 @@ class TestVector:
         assert zero.x == 0.0
         assert zero.y == 0.0
 
+    def test_vector_immutability(self) -> None:
+        """Test that coordinates are read-only, so cached values stay valid."""
+        v = Vector(3, 4)
+        assert abs(v) == 5.0
+
+        with pytest.raises(AttributeError):
+            v.x = 0.0  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            v.y = 0.0  # type: ignore[misc]
+
+        assert (v.x, v.y) == (3.0, 4.0)
+        assert abs(v) == 5.0
+
+    def test_vector_has_no_instance_dict(self) -> None:
+        """Test that vectors store coordinates in slots, not a __dict__."""
+        v = Vector(3, 4)
+        assert not hasattr(v, "__dict__")
+        with pytest.raises(AttributeError):
+            v.z = 5.0  # type: ignore[attr-defined]
+
     def test_vector_repr(self) -> None:
         """Test vector representation."""
         v = Vector(3, 4)
@@ -142,6 +176,18 @@ class TestVector:
         assert len(vector_set) == 2  # v1 and v2 are the same
         assert v1 in vector_set
 
+    def test_vector_cached_hash_matches_equality(self) -> None:
+        """Test that a cached hash stays consistent with equality."""
+        v = Vector(3, 4)
+        first = hash(v)
+
+        with pytest.raises(AttributeError):
+            v.x = 0.0  # type: ignore[misc]
+
+        assert hash(v) == first == hash(Vector(3, 4))
+        assert v in {Vector(3, 4)}
+        assert v not in {Vector(0, 4)}
+
     def test_vector_negation(self) -> None:
         """Test vector negation."""
         v = Vector(3, 4)
@@ -207,20 +253,8 @@ class TestVector:
         # Distance should be symmetric
         assert v2.distance_to(v1) == distance
 
-    @given(
-        x1=st.floats(
-            min_value=-100, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-        y1=st.floats(
-            min_value=-100, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-        x2=st.floats(
-            min_value=-100, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-        y2=st.floats(
-            min_value=-100, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-    )
+    @settings(max_examples=30, deadline=None)
+    @given(x1=coordinates, y1=coordinates, x2=coordinates, y2=coordinates)
     def test_vector_addition_commutative(
         self, x1: float, y1: float, x2: float, y2: float
     ) -> None:
@@ -230,17 +264,8 @@ class TestVector:
 
         assert v1 + v2 == v2 + v1
 
-    @given(
-        x=st.floats(
-            min_value=-100, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-        y=st.floats(
-            min_value=-100, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-        scalar=st.floats(
-            min_value=-10, max_value=10, allow_nan=False, allow_infinity=False
-        ),
-    )
+    @settings(max_examples=30, deadline=None)
+    @given(x=coordinates, y=coordinates, scalar=scalars)
     def test_vector_multiplication_properties(
         self, x: float, y: float, scalar: float
     ) -> None:
@@ -257,14 +282,8 @@ class TestVector:
         zero_result = v * 0
         assert zero_result == Vector(0, 0)
 
-    @given(
-        x=st.floats(
-            min_value=0.1, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-        y=st.floats(
-            min_value=0.1, max_value=100, allow_nan=False, allow_infinity=False
-        ),
-    )
+    @settings(max_examples=30, deadline=None)
+    @given(x=positive_coordinates, y=positive_coordinates)
     def test_vector_normalization_property(self, x: float, y: float) -> None:
         """Property test: normalization produces unit vector."""
         v = Vector(x, y)
@@ -284,6 +303,15 @@ class TestVectorEdgeCases:
         assert v.y == 1e-10
         assert abs(v) > 0
 
+    def test_normalize_subnormal_vector(self) -> None:
+        """Test normalizing a vector whose magnitude is subnormal."""
+        v = Vector(1e-310, 0)
+        assert v.normalized() == Vector(1.0, 0.0)
+
+    def test_normalize_is_correctly_rounded(self) -> None:
+        """Test that normalized components match plain division."""
+        assert Vector(3, 4).normalized() == Vector(0.6, 0.8)
+
     def test_vector_operations_preserve_type(self) -> None:
         """Test that operations return Vector instances."""
         v1 = Vector(1, 2)
@@ -300,13 +328,13 @@ class TestVectorEdgeCases:
 class TestDemonstration:
     """Test the demonstration function."""
 
-    def test_demonstrate_vector_operations_runs(
-        self, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_demonstrate_vector_operations_runs(self) -> None:
         """Test that the demonstration function runs without error."""
-        demonstrate_vector_operations()
-
-        captured = capsys.readouterr()
-        assert "Vector Operations Demo" in captured.out
-        assert "Arithmetic:" in captured.out
-        assert "Magnitude and normalization:" in captured.out
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            demonstrate_vector_operations()
+
+        output = buffer.getvalue()
+        assert "Vector Operations Demo" in output
+        assert "Arithmetic:" in output
+        assert "Magnitude and normalization:" in output
@@ -0,0 +1,159 @@
+"""
+Tests for the NumPy-backed VectorArray.
+
+Tests cover:
+- Construction and conversion to and from Vector
+- Element-wise arithmetic
+- Batch magnitude, dot product and distance, with and without Numba
+- Agreement with the scalar Vector implementation
+"""
+
+import math
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+np = pytest.importorskip("numpy")
+
+from fluent_python.ch01_data_model.robust import vector_array  # noqa: E402
+from fluent_python.ch01_data_model.robust.vector import Vector  # noqa: E402
+from fluent_python.ch01_data_model.robust.vector_array import (  # noqa: E402
+    VectorArray,
+)
+
+coordinates = st.floats(
+    min_value=-100, max_value=100, allow_nan=False, allow_infinity=False
+)
+
+
+class TestVectorArray:
+    """Test cases for the VectorArray class."""
+
+    def test_creation(self) -> None:
+        """Test construction stores float64 coordinate arrays."""
+        va = VectorArray([1, 2, 3], [4, 5, 6])
+        assert len(va) == 3
+        assert va.xs.dtype == np.float64
+        assert va.ys.tolist() == [4.0, 5.0, 6.0]
+
+    def test_creation_shape_mismatch(self) -> None:
+        """Test that mismatched coordinate arrays are rejected."""
+        with pytest.raises(ValueError, match="equal length"):
+            VectorArray([1, 2], [1, 2, 3])
+
+        with pytest.raises(ValueError, match="one-dimensional"):
+            VectorArray([[1, 2]], [[3, 4]])
+
+    def test_from_vectors_roundtrip(self) -> None:
+        """Test packing Vectors and iterating them back out."""
+        vectors = [Vector(3, 4), Vector(-1, 2), Vector()]
+        va = VectorArray.from_vectors(vectors)
+        assert list(va) == vectors
+
+    def test_from_vectors_empty(self) -> None:
+        """Test packing an empty iterable."""
+        va = VectorArray.from_vectors([])
+        assert len(va) == 0
+        assert list(va) == []
+
+    def test_repr(self) -> None:
+        """Test developer-friendly representation."""
+        va = VectorArray([1, 2], [3, 4])
+        assert repr(va) == "VectorArray(xs=[1.0, 2.0], ys=[3.0, 4.0])"
+
+    def test_equality(self) -> None:
+        """Test equality compares all coordinates in order."""
+        assert VectorArray([1, 2], [3, 4]) == VectorArray([1, 2], [3, 4])
+        assert VectorArray([1, 2], [3, 4]) != VectorArray([2, 1], [4, 3])
+        assert VectorArray([1], [2]) != "not a vector array"
+
+    def test_arithmetic(self) -> None:
+        """Test element-wise addition, subtraction and scaling."""
+        a = VectorArray([1, 2], [3, 4])
+        b = VectorArray([10, 20], [30, 40])
+
+        assert a + b == VectorArray([11, 22], [33, 44])
+        assert b - a == VectorArray([9, 18], [27, 36])
+        assert a * 2 == VectorArray([2, 4], [6, 8])
+        assert 2 * a == a * 2
+
+    def test_arithmetic_type_error(self) -> None:
+        """Test arithmetic with unsupported operands."""
+        a = VectorArray([1, 2], [3, 4])
+        with pytest.raises(TypeError):
+            a + Vector(1, 2)
+        with pytest.raises(TypeError):
+            a * "invalid"
+
+    def test_abs(self) -> None:
+        """Test batch magnitude."""
+        va = VectorArray([3, 0, 5], [4, 0, 12])
+        assert abs(va).tolist() == [5.0, 0.0, 13.0]
+
+    def test_dot(self) -> None:
+        """Test batch dot product."""
+        a = VectorArray([3, 1], [4, 0])
+        b = VectorArray([2, 5], [1, 7])
+        assert a.dot(b).tolist() == [10.0, 5.0]
+
+    def test_distance_to(self) -> None:
+        """Test batch distance."""
+        a = VectorArray([0, 1], [0, 1])
+        b = VectorArray([3, 1], [4, -1])
+        assert a.distance_to(b).tolist() == [5.0, 2.0]
+
+    def test_length_mismatch(self) -> None:
+        """Test that pairwise operations reject batches of different lengths."""
+        a = VectorArray([1, 2], [3, 4])
+        b = VectorArray([1], [2])
+        with pytest.raises(ValueError, match="lengths differ"):
+            a.dot(b)
+        with pytest.raises(ValueError, match="lengths differ"):
+            a.distance_to(b)
+
+    def test_numpy_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that results are the same without the Numba kernels."""
+        a = VectorArray([3, 1, -2], [4, 0, 5])
+        b = VectorArray([2, 5, 1], [1, 7, -3])
+        expected_dot = a.dot(b).tolist()
+        expected_distance = a.distance_to(b).tolist()
+
+        monkeypatch.setattr(vector_array, "_kernels", lambda: None)
+        assert a.dot(b).tolist() == expected_dot
+        assert a.distance_to(b).tolist() == expected_distance
+
+    def test_numba_kernels(self) -> None:
+        """Test that the compiled kernels match the NumPy expressions."""
+        pytest.importorskip("numba")
+        kernels = vector_array._kernels()
+        assert kernels is not None
+        batch_dot, batch_distance = kernels
+
+        rng = np.random.default_rng(0)
+        x1, y1, x2, y2 = rng.uniform(-100, 100, size=(4, 1000))
+        out = np.empty_like(x1)
+
+        dot = batch_dot(x1, y1, x2, y2, out.copy())
+        np.testing.assert_allclose(dot, x1 * x2 + y1 * y2)
+
+        distance = batch_distance(x1, y1, x2, y2, out.copy())
+        np.testing.assert_allclose(distance, np.hypot(x1 - x2, y1 - y2))
+
+    @given(st.lists(st.tuples(coordinates, coordinates), max_size=20))
+    def test_matches_scalar_vector(self, points: list[tuple[float, float]]) -> None:
+        """Property test: batch results match the scalar Vector methods."""
+        vectors = [Vector(x, y) for x, y in points]
+        va = VectorArray.from_vectors(vectors)
+        others = VectorArray.from_vectors(reversed(vectors))
+
+        for v, w, magnitude, dot, distance in zip(
+            vectors,
+            reversed(vectors),
+            abs(va),
+            va.dot(others),
+            va.distance_to(others),
+        ):
+            assert math.isclose(magnitude, abs(v))
+            assert math.isclose(dot, v.dot(w), abs_tol=1e-9)
+            assert math.isclose(distance, v.distance_to(w), abs_tol=1e-9)